@@ -12,9 +12,14 @@ Features:
 - Automatic folder creation
 """
 
+import atexit
+import importlib.util
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import threading
+import itertools
+import multiprocessing
 import queue
 import json
 import csv
@@ -22,10 +27,25 @@ import random
 import os
 import sys
 import re
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx needs the h2 package for HTTP/2
+if httpx is not None and importlib.util.find_spec("h2") is None:
+    httpx = None
 
 try:
     import yt_dlp
@@ -50,6 +70,17 @@ VIDEO_KEYWORDS_FILE = None  # Set to None to use keywords from scraper
 MAX_RESULTS_PER_KEYWORD = 20
 VIDEO_THREADS = 50
 VIDEO_STRICTNESS = "strict"  # "strict" or "relaxed"
+VIDEO_RESUME_FILE = None  # Path to an earlier Videos/*.csv to continue instead of starting a new file
+VIDEO_REQUESTS_PER_SECOND = 10  # Global cap on yt-dlp searches across all threads
+VIDEO_USE_PROCESSES = False  # True runs each yt-dlp search in a worker process (one per video thread)
+RATE_LIMIT_PAUSE = 60  # Seconds all video threads pause after a 429
+CSV_FLUSH_EVERY = 20  # Flush the videos CSV and progress db every N keywords
+
+# --- AUTOCOMPLETE CACHE ---
+CACHE_DB_FILE = "keywords_cache.db"
+CACHE_TTL_DAYS = 7
+CACHE_COMMIT_EVERY = 100  # Cache writes are committed in batches of this many rows
+USE_CACHE = not os.environ.get("NO_CACHE")  # Run with NO_CACHE=1 to bypass
 
 # --- OUTPUT FOLDERS ---
 KEYWORDS_OUTPUT_FOLDER = "Keywords"
@@ -59,20 +90,9 @@ VIDEOS_OUTPUT_FOLDER = "Videos"
 # --- INPUT DATA CONFIGURATION ---
 INPUT_KEYWORDS_FILE = "InputKeywords.txt"
 
-# Load keywords from file
-try:
-    with open(INPUT_KEYWORDS_FILE, "r", encoding="utf-8") as f:
-        SEED_KEYWORDS = [line.strip() for line in f if line.strip()]
-    
-    if SEED_KEYWORDS:
-        print(f"Loaded {len(SEED_KEYWORDS)} keywords from {INPUT_KEYWORDS_FILE}")
-    else:
-        print(f"Warning: {INPUT_KEYWORDS_FILE} is empty!")
-        SEED_KEYWORDS = []
-
-except FileNotFoundError:
-    print(f"Warning: {INPUT_KEYWORDS_FILE} not found!")
-    SEED_KEYWORDS = []
+# Loaded from INPUT_KEYWORDS_FILE by main(), so yt-dlp worker processes
+# (which re-import this module) don't re-read and re-announce it
+SEED_KEYWORDS = []
 
 # --- PROXY CONFIGURATION (Optional) ---
 PROXIES = []  # Example: ["http://IP:PORT"]
@@ -101,108 +121,380 @@ USER_AGENTS = [
     "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1",
 ]
 
+# JSONP callback wrapping autocomplete responses
+JSONP_PREFIX = b"window.google.ac.h("
+
+# All filter words in one pattern so is_allowed does a single scan
+_FILTER_RE = re.compile("|".join(map(re.escape, FILTER_KEYWORDS))) if FILTER_KEYWORDS else None
+
 # Global storage for keywords scraper
-keyword_tree = defaultdict(list)
+keyword_tree = defaultdict(set)  # parent -> unique children
 collected = set()
+collected_count = 0  # Only updated under lock, read without it
+keyword_stop = threading.Event()  # Set once MAX_KEYWORDS have been collected
 task_queue = queue.Queue()
 depth_map = {}
 keyword_source = {}
 lock = threading.Lock()
 
+# Per-thread HTTP session so autocomplete requests reuse keep-alive sockets
+_tls = threading.local()
+_ua_cycle = itertools.cycle(USER_AGENTS)  # Hands out User-Agents to new threads in turn
+_http2_client = None  # Shared httpx client, used instead when httpx is installed
+_http2_failed = False  # Set if the httpx client couldn't be created; requests is used instead
+_http2_client_lock = threading.Lock()
+
+# On-disk cache of autocomplete responses, shared by all keyword threads
+_cache_db = None
+_cache_pending = 0  # Writes since the last commit
+cache_lock = threading.Lock()
+
+# In-flight autocomplete lookups, so duplicate queries share one request
+_inflight = {}
+
 # Global locks for thread safety
-csv_lock = threading.Lock()
 print_lock = threading.Lock()
 
+# Keywords waiting for video scraping; fed by the keyword crawl when pipelined
+video_work_q = queue.Queue()
+video_pipeline = threading.Event()  # Set while keyword workers stream into video_work_q
+
+# Video rows are appended by a single writer thread fed through this queue
+video_write_queue = queue.Queue()
+
+# yt-dlp options shared by every video thread
+YDL_OPTS = {
+    'quiet': True,
+    'extract_flat': True,
+    'noplaylist': True,
+    'ignoreerrors': False,
+    'no_warnings': True,
+    'nocheckcertificate': True,
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+}
+
+if PROXY_URL:
+    YDL_OPTS['proxy'] = PROXY_URL
+
+# Shared rate limiting for yt-dlp searches across all video threads
+backoff_until = 0.0  # time.monotonic() deadline set when any thread sees a 429
+backoff_lock = threading.Lock()
+
+# Worker processes running yt-dlp searches when VIDEO_USE_PROCESSES is on
+video_process_pool = None
+
+# One YoutubeDL per video thread, reused across keywords
+_ydl_tls = threading.local()
+_ydl_instances = []
+_ydl_instances_lock = threading.Lock()
+
 
 # ============================================
 # KEYWORDS FINDER FUNCTIONS
 # ============================================
 
-def get_suggestions(query):
-    """Fetch keyword suggestions from YouTube autocomplete API"""
-    results = set()
-    proxy = None
-    if PROXIES:
-        proxy = {"http": PROXIES[0], "https": PROXIES[0]}
-
-    for endpoint in ENDPOINTS:
-        for attempt in range(3):
-            try:
-                headers = {"User-Agent": random.choice(USER_AGENTS)}
-                url = endpoint.format(query)
-                # print(f"DEBUG: Requesting {url}...")  # Verbose debug
-                resp = requests.get(url, headers=headers, proxies=proxy, timeout=5)
+def load_seed_keywords():
+    """Load seed keywords from INPUT_KEYWORDS_FILE"""
+    try:
+        with open(INPUT_KEYWORDS_FILE, "r", encoding="utf-8") as f:
+            seeds = [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        print(f"Warning: {INPUT_KEYWORDS_FILE} not found!")
+        return []
+
+    if seeds:
+        print(f"Loaded {len(seeds)} keywords from {INPUT_KEYWORDS_FILE}")
+    else:
+        print(f"Warning: {INPUT_KEYWORDS_FILE} is empty!")
+    return seeds
+
+
+def get_session():
+    """Return the HTTP client for autocomplete requests, creating it on first use
+
+    With httpx (and h2) installed, all threads share one HTTP/2 client whose
+    connection multiplexes their requests. Otherwise each thread gets its
+    own pooled keep-alive requests.Session.
+    """
+    global _http2_client, _http2_failed
+    if httpx is not None and not _http2_failed:
+        if _http2_client is None:
+            with _http2_client_lock:
+                if _http2_client is None and not _http2_failed:
+                    client_kwargs = {}
+                    if PROXIES:
+                        client_kwargs["proxy"] = PROXIES[0]  # Needs httpx >= 0.26
+                    try:
+                        _http2_client = httpx.Client(
+                            http2=True,
+                            # requests follows redirects by default; httpx doesn't
+                            follow_redirects=True,
+                            limits=httpx.Limits(max_connections=KEYWORD_THREADS * 4,
+                                                max_keepalive_connections=KEYWORD_THREADS * 4),
+                            **client_kwargs,
+                        )
+                    except Exception as e:
+                        print(f"Warning: could not create HTTP/2 client ({e!r}); using requests instead")
+                        _http2_failed = True
+                    else:
+                        atexit.register(_http2_client.close)
+        if _http2_client is not None:
+            return _http2_client
+
+    session = getattr(_tls, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=KEYWORD_THREADS,
+                              pool_maxsize=KEYWORD_THREADS * 2,
+                              max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        if PROXIES:
+            session.proxies = {"http": PROXIES[0], "https": PROXIES[0]}
+        _tls.session = session
+    return session
+
+
+def get_user_agent():
+    """Return this thread's User-Agent, picked from the rotation on first use
+
+    It is sent as a per-request header, so a thread keeps the same
+    User-Agent even when all threads share one httpx client.
+    """
+    user_agent = getattr(_tls, "user_agent", None)
+    if user_agent is None:
+        user_agent = _tls.user_agent = next(_ua_cycle)
+    return user_agent
+
+
+def get_cache_db():
+    """Open the autocomplete cache database (caller must hold cache_lock)"""
+    global _cache_db
+    if _cache_db is None:
+        _cache_db = sqlite3.connect(CACHE_DB_FILE, check_same_thread=False)
+        _cache_db.execute("PRAGMA journal_mode=WAL")
+        _cache_db.execute("PRAGMA synchronous=NORMAL")
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS autocomplete ("
+            "endpoint INTEGER, query TEXT, ts INTEGER, suggestions TEXT, "
+            "PRIMARY KEY (endpoint, query))"
+        )
+    return _cache_db
+
+
+def cache_get(endpoint_index, query):
+    """Return cached suggestions for (endpoint, query), or None if missing/stale"""
+    if not USE_CACHE:
+        return None
+    with cache_lock:
+        row = get_cache_db().execute(
+            "SELECT ts, suggestions FROM autocomplete WHERE endpoint = ? AND query = ?",
+            (endpoint_index, query),
+        ).fetchone()
+    if row is None or time.time() - row[0] > CACHE_TTL_DAYS * 86400:
+        return None
+    return json_loads(row[1])
+
+
+def cache_put(endpoint_index, query, suggestions):
+    """Store the parsed suggestions list for (endpoint, query)"""
+    global _cache_pending
+    if not USE_CACHE:
+        return
+    with cache_lock:
+        db = get_cache_db()
+        db.execute(
+            "INSERT OR REPLACE INTO autocomplete VALUES (?, ?, ?, ?)",
+            (endpoint_index, query, int(time.time()), json.dumps(suggestions)),
+        )
+        _cache_pending += 1
+        if _cache_pending >= CACHE_COMMIT_EVERY:
+            db.commit()
+            _cache_pending = 0
+
+
+def close_cache():
+    """Commit pending writes and close the autocomplete cache database if it was opened"""
+    global _cache_db, _cache_pending
+    with cache_lock:
+        if _cache_db is not None:
+            _cache_db.commit()
+            _cache_db.close()
+            _cache_db = None
+            _cache_pending = 0
+
+
+def fetch_endpoint_suggestions(endpoint, query, session):
+    """Query a single autocomplete endpoint; returns None if it never answered"""
+    for attempt in range(3):
+        try:
+            url = endpoint.format(query)
+            # print(f"DEBUG: Requesting {url}...")  # Verbose debug
+            resp = session.get(url, timeout=5, headers={"User-Agent": get_user_agent()})
+            
+            if resp.status_code == 200:
+                # Parse the raw bytes to skip decoding the body to str
+                content = resp.content
+                if content.startswith(JSONP_PREFIX):
+                    # Payload is a JSON array, so only the callback's ")" trails it
+                    content = content[len(JSONP_PREFIX):].rstrip(b"); \r\n")
                 
-                if resp.status_code == 200:
-                    content = resp.text
-                    if content.startswith("window.google.ac.h("):
-                        content = content[content.find("(")+1 : content.rfind(")")]
-                    
-                    data = json.loads(content)
-                    
-                    if len(data) > 1 and data[1]:
-                        for item in data[1]:
-                            if isinstance(item, list) and len(item) > 0:
-                                results.add(item[0])
-                            elif isinstance(item, str):
-                                results.add(item)
-                    break
-                    
-                elif resp.status_code == 403:
-                    wait_time = (attempt + 1) * 2
-                    time.sleep(wait_time)
-                else:
-                    break
-            except Exception as e:
-                time.sleep(1)
+                data = json_loads(content)
+                
+                results = []
+                if len(data) > 1 and data[1]:
+                    for item in data[1]:
+                        if isinstance(item, list) and len(item) > 0:
+                            results.append(item[0])
+                        elif isinstance(item, str):
+                            results.append(item)
+                return results
+                
+            elif resp.status_code == 403:
+                wait_time = (attempt + 1) * 2
+                time.sleep(wait_time)
+            else:
+                return None
+        except Exception as e:
+            time.sleep(1)
+    return None
+
+
+def fetch_suggestions(query):
+    """Fetch keyword suggestions from the first autocomplete endpoint that has any (cache-aware)
+
+    ENDPOINTS[0] is always asked first; the next endpoint is only queried
+    when the previous one failed or returned nothing.
+    """
+    session = get_session()
+
+    for index, endpoint in enumerate(ENDPOINTS):
+        suggestions = cache_get(index, query)
+        if suggestions is None:
+            suggestions = fetch_endpoint_suggestions(endpoint, query, session)
+            if suggestions is None:
+                continue
+            cache_put(index, query, suggestions)
+        if suggestions:
+            return list(dict.fromkeys(suggestions))
     
-    return list(results)
+    return []
+
+
+def get_suggestions(query):
+    """Fetch keyword suggestions from YouTube autocomplete API
+
+    Concurrent calls for the same query share a single fetch: the first
+    caller does the work and the others wait on its Future.
+    """
+    with lock:
+        fut = _inflight.get(query)
+        owner = fut is None
+        if owner:
+            fut = Future()
+            _inflight[query] = fut
+
+    if not owner:
+        return fut.result()
+
+    try:
+        results = fetch_suggestions(query)
+        fut.set_result(results)
+        return results
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with lock:
+            _inflight.pop(query, None)
 
 
 def is_allowed(keyword):
     """Check if keyword passes filter"""
-    k = keyword.lower()
-    return not any(f in k for f in FILTER_KEYWORDS)
+    return _FILTER_RE is None or _FILTER_RE.search(keyword.lower()) is None
 
 
 def keyword_worker():
     """Worker thread for keywords scraping"""
+    global collected_count
     while True:
-        try:
-            kw = task_queue.get(timeout=3)
-        except:
+        kw = task_queue.get()
+        if kw is None:
+            task_queue.task_done()
             return
 
-        depth = depth_map.get(kw, 0)
+        try:
+            depth = depth_map.get(kw, 0)
 
-        if len(collected) >= MAX_KEYWORDS:
-            return
+            # Once the limit is hit, any stragglers are dropped without fetching
+            if keyword_stop.is_set():
+                continue
 
-        if depth > MAX_DEPTH:
-            continue
+            if depth > MAX_DEPTH:
+                continue
 
-        suggestions = get_suggestions(kw)
+            suggestions = get_suggestions(kw)
 
-        with lock:
-            if kw not in collected:
-                collected.add(kw)
-                print(f"[Keywords {len(collected)}/{MAX_KEYWORDS}] {kw}")
+            with lock:
+                if keyword_stop.is_set():
+                    continue
+                if kw not in collected:
+                    collected.add(kw)
+                    collected_count += 1
+                    print(f"[Keywords {collected_count}/{MAX_KEYWORDS}] {kw}")
+                    if video_pipeline.is_set():
+                        video_work_q.put(kw)
+                    if collected_count >= MAX_KEYWORDS:
+                        keyword_stop.set()
+
+            if keyword_stop.is_set():
+                # Limit reached: discard the frontier instead of expanding it
+                drain_task_queue()
+                continue
 
-        for s in suggestions:
-            if not is_allowed(s):
+            # Filter outside the lock, then record all children in one critical section
+            children = [s for s in suggestions if is_allowed(s)]
+            if not children:
                 continue
 
             with lock:
-                keyword_tree[kw].append(s)
+                keyword_tree[kw].update(children)
+                origin = keyword_source.get(kw, kw)
+
+                for s in children:
+                    if s not in collected:
+                        depth_map[s] = depth + 1
+                        if s not in keyword_source:
+                            keyword_source[s] = origin
+                        task_queue.put(s)
+        except Exception as e:
+            # Keep the worker alive: a dead worker would leave task_queue.join() waiting forever
+            print(f"[!] Keyword '{kw}' failed: {e!r}")
+        finally:
+            task_queue.task_done()
+
+
+def drain_task_queue():
+    """Discard all pending keywords without processing them
 
-                if s not in collected:
-                    depth_map[s] = depth + 1
-                    if s not in keyword_source:
-                        keyword_source[s] = keyword_source.get(kw, kw)
-                    task_queue.put(s)
+    Stop sentinels (None) are put back, so a worker draining during shutdown
+    can't swallow the marker meant for another worker.
+    """
+    sentinels = 0
+    while True:
+        try:
+            kw = task_queue.get_nowait()
+        except queue.Empty:
+            break
+        if kw is None:
+            sentinels += 1
+        task_queue.task_done()
+    for _ in range(sentinels):
+        task_queue.put(None)
 
 
-def scrape_keywords():
+def scrape_keywords(descriptive_name=None):
     """Main function to scrape keywords"""
     print("="*60)
     print("STEP 1: KEYWORD SCRAPING")
@@ -217,35 +509,42 @@ def scrape_keywords():
     try:
         with ThreadPoolExecutor(max_workers=KEYWORD_THREADS) as executor:
             futures = [executor.submit(keyword_worker) for _ in range(KEYWORD_THREADS)]
+            try:
+                # Returns as soon as the BFS frontier is exhausted
+                task_queue.join()
+            finally:
+                drain_task_queue()
+                for _ in futures:
+                    task_queue.put(None)
             for f in futures:
                 f.result()
         print("\nKeyword scraping complete.")
     except KeyboardInterrupt:
         print("\n⚠️ Interrupted by User! Saving collected data...")
+    except Exception as e:
+        print(f"\n⚠️ Keyword scraping failed: {e!r}. Saving collected data...")
     finally:
+        close_cache()
         print(f"Total unique keywords: {len(collected)}")
-        return save_keywords()
+
+    return save_keywords(descriptive_name)
+
+
+# Common words to ignore when naming a run
+NAME_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'how',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'your', 'you', 'my'
+})
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
 def analyze_keywords_for_name(keywords_list, max_words=3):
     """Analyze keywords to generate a descriptive name"""
-    from collections import Counter
-    
-    # Common words to ignore
-    stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                 'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'how',
-                 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'your', 'you', 'my'}
-    
-    # Count word frequency across all keywords
-    word_counts = Counter()
+    # Count word frequency across the first 50 keywords in one tokenizer pass
     keywords_as_list = list(keywords_list) if not isinstance(keywords_list, list) else keywords_list
-    for kw in keywords_as_list[:50]:  # Analyze first 50 keywords
-        words = kw.lower().split()
-        for word in words:
-            # Clean word
-            word = re.sub(r'[^a-z0-9]', '', word)
-            if len(word) > 2 and word not in stopwords:
-                word_counts[word] += 1
+    tokens = _TOKEN_RE.findall(" ".join(keywords_as_list[:50]).lower())
+    word_counts = Counter(t for t in tokens if len(t) > 2 and t not in NAME_STOPWORDS)
     
     # Get top words
     top_words = [word for word, count in word_counts.most_common(max_words)]
@@ -258,7 +557,7 @@ def analyze_keywords_for_name(keywords_list, max_words=3):
     return '_'.join(top_words)
 
 
-def save_keywords():
+def save_keywords(descriptive_name=None):
     """Save keywords to files with timestamp"""
     if not collected:
         print("No keywords collected to save.")
@@ -271,7 +570,8 @@ def save_keywords():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Analyze keywords to create descriptive name
-    descriptive_name = analyze_keywords_for_name(collected)
+    if not descriptive_name:
+        descriptive_name = analyze_keywords_for_name(collected)
     
     # Create run folder
     run_folder_name = f"{descriptive_name}_{timestamp}"
@@ -284,12 +584,10 @@ def save_keywords():
     txt_file = os.path.join(run_folder, "keywords.txt")
     
     # Save main keywords
-    df = pd.DataFrame({
-        "Keyword": list(collected),
-        "Depth": [depth_map.get(k, None) for k in collected],
-        "Origin_Seed": [keyword_source.get(k, None) for k in collected]
-    })
-    df.to_csv(csv_file, index=False)
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Keyword", "Depth", "Origin_Seed"])
+        writer.writerows((k, depth_map.get(k), keyword_source.get(k)) for k in collected)
     
     # Save as txt for easy video scraping
     with open(txt_file, 'w', encoding='utf-8') as f:
@@ -297,13 +595,14 @@ def save_keywords():
             f.write(f"{kw}\n")
     
     # Save tree
-    tree_rows = []
-    for parent, children in keyword_tree.items():
-        for child in children:
-            tree_rows.append([parent, child])
-    
-    tree_df = pd.DataFrame(tree_rows, columns=["Parent", "Child"])
-    tree_df.to_csv(tree_file, index=False)
+    with open(tree_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Parent", "Child"])
+        writer.writerows(
+            (parent, child)
+            for parent, children in keyword_tree.items()
+            for child in children
+        )
     
     print(f"\n✅ Keywords files generated in folder: {run_folder_name}/")
     print(f"   - keywords.csv")
@@ -346,25 +645,104 @@ def is_video_relevant(keyword, video_title):
         return (len(common_words) / len(k_words)) >= 0.5
 
 
-def scrape_single_keyword(keyword, output_file):
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a token is available"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_time = (tokens - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+    def empty_until(self, when):
+        """Drop all tokens and start refilling only at time.monotonic() `when`"""
+        with self.lock:
+            self.tokens = 0
+            self.updated = when
+
+
+def trigger_backoff(seconds):
+    """Make all video threads hold off for `seconds`; True if this started a new pause"""
+    global backoff_until
+    with backoff_lock:
+        now = time.monotonic()
+        started = backoff_until <= now
+        backoff_until = max(backoff_until, now + seconds)
+        # Otherwise the bucket refills during the pause and every thread fires at once after it
+        video_rate_limiter.empty_until(backoff_until)
+        return started
+
+
+def wait_for_backoff():
+    """Sleep until any shared 429 pause has expired"""
+    while True:
+        delay = backoff_until - time.monotonic()
+        if delay <= 0:
+            return
+        time.sleep(delay)
+
+
+# Shared by every video thread; a burst of 1 keeps searches evenly spaced
+video_rate_limiter = TokenBucket(VIDEO_REQUESTS_PER_SECOND, 1)
+
+
+def get_ydl():
+    """Return this thread's YoutubeDL instance, creating it on first use"""
+    ydl = getattr(_ydl_tls, "ydl", None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(YDL_OPTS)
+        _ydl_tls.ydl = ydl
+        with _ydl_instances_lock:
+            _ydl_instances.append(ydl)
+    return ydl
+
+
+def close_ydl_instances():
+    """Close every YoutubeDL instance created by the video threads"""
+    with _ydl_instances_lock:
+        while _ydl_instances:
+            _ydl_instances.pop().close()
+
+
+atexit.register(close_ydl_instances)
+
+
+def search_in_process(query):
+    """Run one yt-dlp search inside a worker process, returning only picklable data"""
+    try:
+        info = get_ydl().extract_info(query, download=False)
+    except Exception as e:
+        # yt-dlp errors carry tracebacks that don't pickle; the message is what callers check
+        raise RuntimeError(str(e)) from None
+    return {'entries': list(info.get('entries') or [])}
+
+
+def search_videos(query):
+    """Run a yt-dlp search, in the process pool when VIDEO_USE_PROCESSES is on"""
+    if video_process_pool is not None:
+        return video_process_pool.submit(search_in_process, query).result()
+    return get_ydl().extract_info(query, download=False)
+
+
+def scrape_single_keyword(keyword):
     """Scrape videos for a single keyword"""
     if yt_dlp is None:
         print("Error: yt-dlp not available")
         return
     
-    ydl_opts = {
-        'quiet': True,
-        'extract_flat': True,
-        'noplaylist': True,
-        'ignoreerrors': False,
-        'no_warnings': True,
-        'nocheckcertificate': True,
-        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-    }
-
-    if PROXY_URL:
-        ydl_opts['proxy'] = PROXY_URL
-
     query = f"ytsearch{MAX_RESULTS_PER_KEYWORD}:{keyword}"
     results_to_save = []
     rank_counter = 1
@@ -372,61 +750,67 @@ def scrape_single_keyword(keyword, output_file):
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(query, download=False)
-                if 'entries' in info:
-                    for entry in info['entries']:
-                        if not entry:
-                            continue
-                        title = entry.get('title')
-                        if not title:
-                            continue
+            wait_for_backoff()
+            video_rate_limiter.acquire()
+            info = search_videos(query)
+            if 'entries' in info:
+                for entry in info['entries']:
+                    if not entry:
+                        continue
+                    title = entry.get('title')
+                    if not title:
+                        continue
                         
-                        # Always include video (set to True)
-                        if True:
-                            # Duration Logic
-                            duration_str = entry.get('duration_string')
-                            if not duration_str:
-                                duration_sec = entry.get('duration')
-                                if duration_sec:
-                                    m, s = divmod(duration_sec, 60)
-                                    h, m = divmod(m, 60)
-                                    if h > 0:
-                                        duration_str = f"{int(h)}:{int(m):02d}:{int(s):02d}"
-                                    else:
-                                        duration_str = f"{int(m)}:{int(s):02d}"
+                    # Always include video (set to True)
+                    if True:
+                        # Duration Logic
+                        duration_str = entry.get('duration_string')
+                        if not duration_str:
+                            duration_sec = entry.get('duration')
+                            if duration_sec:
+                                m, s = divmod(duration_sec, 60)
+                                h, m = divmod(m, 60)
+                                if h > 0:
+                                    duration_str = f"{int(h)}:{int(m):02d}:{int(s):02d}"
                                 else:
-                                    duration_str = 'N/A'
+                                    duration_str = f"{int(m)}:{int(s):02d}"
+                            else:
+                                duration_str = 'N/A'
                             
-                            # Upload date formatting
-                            upload_date = entry.get('upload_date', 'N/A')
-                            if upload_date and upload_date != 'N/A':
-                                # Convert YYYYMMDD to YYYY-MM-DD
-                                try:
-                                    upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:]}"
-                                except:
-                                    upload_date = 'N/A'
-
-                            results_to_save.append([
-                                keyword,
-                                rank_counter,
-                                title,
-                                entry.get('uploader') or entry.get('channel') or 'N/A',
-                                entry.get('channel_follower_count') or entry.get('subscriber_count', 'N/A'),
-                                entry.get('view_count', 0),
-                                entry.get('like_count', 'N/A'),
-                                entry.get('comment_count', 'N/A'),
-                                upload_date,
-                                duration_str,
-                                entry.get('url') or entry.get('webpage_url')
-                            ])
-                            rank_counter += 1
+                        # Upload date formatting
+                        upload_date = entry.get('upload_date', 'N/A')
+                        if upload_date and upload_date != 'N/A':
+                            # Convert YYYYMMDD to YYYY-MM-DD
+                            try:
+                                upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:]}"
+                            except:
+                                upload_date = 'N/A'
+
+                        results_to_save.append([
+                            keyword,
+                            rank_counter,
+                            title,
+                            entry.get('uploader') or entry.get('channel') or 'N/A',
+                            entry.get('channel_follower_count') or entry.get('subscriber_count', 'N/A'),
+                            entry.get('view_count', 0),
+                            entry.get('like_count', 'N/A'),
+                            entry.get('comment_count', 'N/A'),
+                            upload_date,
+                            duration_str,
+                            entry.get('url') or entry.get('webpage_url')
+                        ])
+                        rank_counter += 1
             break
         except Exception as e:
             if "429" in str(e):
+                # Pause every video thread, not just this one
+                if trigger_backoff(RATE_LIMIT_PAUSE):
+                    with print_lock:
+                        print(f"!!! CRITICAL: YouTube blocking requests (Error 429). Pausing all threads for {RATE_LIMIT_PAUSE}s...")
+                if attempt < max_retries - 1:
+                    continue
                 with print_lock:
-                    print(f"!!! CRITICAL: YouTube blocking requests (Error 429). Pausing...")
-                time.sleep(60)
+                    print(f"[-] '{keyword}': Failed after {max_retries} attempts")
                 return
             
             if "403" in str(e) or "Forbidden" in str(e):
@@ -440,14 +824,13 @@ def scrape_single_keyword(keyword, output_file):
                     with print_lock:
                         print(f"[-] '{keyword}': Failed after {max_retries} attempts")
                     return
+            # Anything else (incl. a broken process pool) would otherwise fail silently
+            with print_lock:
+                print(f"[-] '{keyword}': {e}")
             return
 
-    # Write to file safely
-    if results_to_save:
-        with csv_lock:
-            with open(output_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerows(results_to_save)
+    # Hand rows to the writer thread, which also marks the keyword done
+    video_write_queue.put((keyword, results_to_save))
     
     with print_lock:
         if results_to_save:
@@ -458,6 +841,145 @@ def scrape_single_keyword(keyword, output_file):
     time.sleep(random.uniform(1.0, 3.0))
 
 
+def progress_db_path(output_file):
+    """Path of the sidecar database tracking which keywords are done for output_file"""
+    return os.path.splitext(output_file)[0] + ".progress.db"
+
+
+def open_progress_db(output_file):
+    """Open (creating if needed) the progress sidecar for output_file"""
+    db = sqlite3.connect(progress_db_path(output_file))
+    db.execute("CREATE TABLE IF NOT EXISTS done (kw TEXT PRIMARY KEY, done_ts INTEGER)")
+    return db
+
+
+def load_done_keywords(output_file):
+    """Return the keywords already scraped into output_file by earlier runs"""
+    if not os.path.exists(progress_db_path(output_file)):
+        return set()
+    db = open_progress_db(output_file)
+    try:
+        return {row[0] for row in db.execute("SELECT kw FROM done")}
+    finally:
+        db.close()
+
+
+def video_csv_writer(output_file):
+    """Writer thread: append (keyword, rows) items from video_write_queue until a None sentinel
+
+    The CSV and its progress db are only created once the first keyword is
+    done, so a run that finds nothing to scrape leaves no empty files behind.
+    """
+    item = video_write_queue.get()
+    if item is None:
+        return
+    new_file = not os.path.exists(output_file)
+    db = open_progress_db(output_file)
+    try:
+        with open(output_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(['Keyword', 'Rank', 'Title', 'Channel', 'Subscribers', 'Views', 'Likes', 'Comments_Count', 'Upload_Date', 'Duration', 'Link'])
+            pending = 0
+            while item is not None:
+                keyword, rows = item
+                writer.writerows(rows)
+                db.execute("INSERT OR IGNORE INTO done VALUES (?, ?)", (keyword, int(time.time())))
+                pending += 1
+                # Rows hit the disk before their keywords are marked done
+                if pending >= CSV_FLUSH_EVERY:
+                    f.flush()
+                    db.commit()
+                    pending = 0
+                item = video_write_queue.get()
+            f.flush()
+            db.commit()
+    finally:
+        db.close()
+
+
+def video_worker():
+    """Worker thread: scrape keywords from video_work_q until a None sentinel"""
+    while True:
+        kw = video_work_q.get()
+        if kw is None:
+            return
+        try:
+            scrape_single_keyword(kw)
+        except Exception as e:
+            with print_lock:
+                print(f"[-] '{kw}': {e}")
+
+
+def prepare_video_output(descriptive_name):
+    """Pick the videos CSV for this run; returns (output_file, keywords already done)"""
+    os.makedirs(VIDEOS_OUTPUT_FOLDER, exist_ok=True)
+    
+    # Resume logic: continue an earlier run's CSV when VIDEO_RESUME_FILE is set
+    if VIDEO_RESUME_FILE:
+        output_file = VIDEO_RESUME_FILE
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = os.path.join(VIDEOS_OUTPUT_FOLDER, f"{descriptive_name}_{timestamp}.csv")
+
+    return output_file, load_done_keywords(output_file)
+
+
+def start_video_pipeline(output_file):
+    """Start the CSV writer and VIDEO_THREADS video workers"""
+    global video_process_pool
+    if VIDEO_USE_PROCESSES:
+        # One process per video thread, so the pool never caps searches in flight;
+        # spawn, not fork: other threads may already be holding locks
+        video_process_pool = ProcessPoolExecutor(
+            max_workers=VIDEO_THREADS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    writer_thread = threading.Thread(target=video_csv_writer, args=(output_file,))
+    writer_thread.start()
+    workers = [threading.Thread(target=video_worker) for _ in range(VIDEO_THREADS)]
+    for t in workers:
+        t.start()
+    return workers, writer_thread
+
+
+def drain_video_queue():
+    """Discard all keywords still waiting for video scraping"""
+    while True:
+        try:
+            video_work_q.get_nowait()
+        except queue.Empty:
+            return
+
+
+def shutdown_video_process_pool():
+    """Stop the yt-dlp worker processes, if any were started"""
+    global video_process_pool
+    if video_process_pool is not None:
+        video_process_pool.shutdown()
+        video_process_pool = None
+
+
+def stop_video_pipeline(workers, writer_thread):
+    """Let queued keywords finish, then shut down the video workers and writer"""
+    try:
+        for _ in workers:
+            video_work_q.put(None)
+        for t in workers:
+            t.join()
+    except KeyboardInterrupt:
+        print("\n⚠️ Interrupted by User! Finishing videos in progress...")
+        drain_video_queue()
+        for _ in workers:
+            video_work_q.put(None)
+        for t in workers:
+            t.join()
+    finally:
+        video_write_queue.put(None)
+        writer_thread.join()
+        shutdown_video_process_pool()
+
+
 def scrape_videos(keywords_file, descriptive_name=None):
     """Main function to scrape videos"""
     if yt_dlp is None:
@@ -476,35 +998,11 @@ def scrape_videos(keywords_file, descriptive_name=None):
     with open(keywords_file, 'r', encoding='utf-8') as f:
         keywords = [line.strip() for line in f if line.strip()]
 
-    # Create output folder
-    os.makedirs(VIDEOS_OUTPUT_FOLDER, exist_ok=True)
-    
-    # Generate timestamp and output filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
     # Use descriptive name if provided, otherwise analyze keywords
     if not descriptive_name:
         descriptive_name = analyze_keywords_for_name(keywords)
     
-    output_file = os.path.join(VIDEOS_OUTPUT_FOLDER, f"{descriptive_name}_{timestamp}.csv")
-    
-    # Resume logic
-    processed_keywords = set()
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            try:
-                next(reader)
-                for row in reader:
-                    if row:
-                        processed_keywords.add(row[0])
-            except:
-                pass
-    else:
-        # Create file with header
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Keyword', 'Rank', 'Title', 'Channel', 'Subscribers', 'Views', 'Likes', 'Comments_Count', 'Upload_Date', 'Duration', 'Link'])
+    output_file, processed_keywords = prepare_video_output(descriptive_name)
 
     keywords_to_do = [k for k in keywords if k not in processed_keywords]
     
@@ -512,23 +1010,54 @@ def scrape_videos(keywords_file, descriptive_name=None):
     print(f"Already Done:   {len(processed_keywords)}")
     print(f"Remaining:      {len(keywords_to_do)}")
     print(f"Active Threads: {VIDEO_THREADS}")
-    print(f"Output File:    {descriptive_name}_{timestamp}.csv")
+    print(f"Output File:    {os.path.basename(output_file)}")
     print("Starting in 3 seconds...")
     time.sleep(3)
 
     # Parallel execution
-    with ThreadPoolExecutor(max_workers=VIDEO_THREADS) as executor:
-        executor.map(lambda k: scrape_single_keyword(k, output_file), keywords_to_do)
+    workers, writer_thread = start_video_pipeline(output_file)
+    for kw in keywords_to_do:
+        video_work_q.put(kw)
+    stop_video_pipeline(workers, writer_thread)
 
     print(f"\n✅ Videos saved to: {output_file}")
 
 
+def scrape_keywords_and_videos():
+    """Run the keyword crawl and video scraping concurrently
+
+    Every newly collected keyword is handed straight to the video workers,
+    so video scraping starts while the keyword BFS is still running.
+    """
+    # Name the run from the seeds, since the videos file is created up front
+    descriptive_name = analyze_keywords_for_name(SEED_KEYWORDS)
+    output_file, _ = prepare_video_output(descriptive_name)  # Fresh file: resuming runs go through scrape_videos
+    print(f"Videos are scraped as keywords are found (Threads: {VIDEO_THREADS})")
+    print(f"Videos Output File: {os.path.basename(output_file)}\n")
+
+    workers, writer_thread = start_video_pipeline(output_file)
+    video_pipeline.set()
+    try:
+        result = scrape_keywords(descriptive_name)
+    finally:
+        video_pipeline.clear()
+        print("\nWaiting for video scraping to finish...")
+        stop_video_pipeline(workers, writer_thread)
+
+    if result is not None:
+        print(f"\n✅ Videos saved to: {output_file}")
+    return result
+
+
 # ============================================
 # MAIN EXECUTION
 # ============================================
 
 def main():
     """Main execution function"""
+    global SEED_KEYWORDS
+    SEED_KEYWORDS = load_seed_keywords()
+
     print("\n" + "="*60)
     print("UNIFIED YOUTUBE SCRAPER")
     print("="*60)
@@ -537,18 +1066,24 @@ def main():
     print(f"Max Results per Video Keyword: {MAX_RESULTS_PER_KEYWORD}")
     print("="*60 + "\n")
     
-    # Step 1: Scrape keywords
-    result = scrape_keywords()
-    
-    if result is None:
-        print("No keywords collected. Exiting.")
-        return
-    
-    keywords_txt_file, descriptive_name = result
-    
-    # Step 2: Scrape videos
-    video_input = VIDEO_KEYWORDS_FILE if VIDEO_KEYWORDS_FILE else keywords_txt_file
-    scrape_videos(video_input, descriptive_name)
+    if VIDEO_KEYWORDS_FILE or VIDEO_RESUME_FILE or yt_dlp is None or not SEED_KEYWORDS:
+        # Step 1: Scrape keywords
+        result = scrape_keywords()
+        
+        if result is None:
+            print("No keywords collected. Exiting.")
+            return
+        
+        keywords_txt_file, descriptive_name = result
+        
+        # Step 2: Scrape videos
+        video_input = VIDEO_KEYWORDS_FILE if VIDEO_KEYWORDS_FILE else keywords_txt_file
+        scrape_videos(video_input, descriptive_name)
+    else:
+        # Steps 1 & 2 overlap: videos are scraped as keywords are collected
+        if scrape_keywords_and_videos() is None:
+            print("No keywords collected. Exiting.")
+            return
     
     print("\n" + "="*60)
     print("✨ ALL DONE!")
@@ -16,12 +16,12 @@ fi
 
 # Check dependencies
 echo "📦 Checking dependencies..."
-python3 -c "import requests, pandas, yt_dlp" 2>/dev/null
+python3 -c "import requests, yt_dlp" 2>/dev/null
 
 if [ $? -ne 0 ]; then
     echo "⚠️  Missing dependencies!"
     echo "Installing required packages..."
-    python3 -m pip install requests pandas openpyxl yt-dlp
+    python3 -m pip install requests yt-dlp
 fi
 
 echo "✅ All dependencies installed"